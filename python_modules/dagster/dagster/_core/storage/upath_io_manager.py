@@ -418,7 +418,8 @@ def _handle_transition_to_partitioned_asset(self, context: OutputContext, path:
 
         # TODO: this might not be the case if the serialization format is already operating with directories
         # e.g. DeltaLake, zarr
-        if path.exists() and path.is_file():
+        # is_file() is False for a missing path, so a separate exists() check would only add a stat
+        if path.is_file():
             context.log.warn(
                 f"Found file at {path} believed to correspond with previously non-partitioned version"
                 f" of {context.asset_key}. Removing {path} and replacing with directory for partitioned data files."
@@ -74,7 +74,9 @@
 
 EPOCH = datetime.datetime.fromtimestamp(0, timezone.utc).replace(tzinfo=None)
 
-PICKLE_PROTOCOL = 4
+# Protocol 5 (PEP 574) is available on every Python version we support and avoids an extra copy
+# of buffer-backed objects (e.g. numpy arrays) when pickling step outputs.
+PICKLE_PROTOCOL = 5
 
 
 DEFAULT_WORKSPACE_YAML_FILENAME = "workspace.yaml"
@@ -233,6 +235,10 @@ def safe_isfile(path: str) -> bool:
 
 
 def mkdir_p(path: str) -> str:
+    # common case for repeated writes into the same directory: a single stat, rather than
+    # stat-ing the parent, failing the mkdir and then stat-ing the path again
+    if os.path.isdir(path):
+        return path
     try:
         os.makedirs(path)
         return path
@@ -40,7 +40,7 @@
 from dagster._core.storage.fs_io_manager import fs_io_manager
 from dagster._core.storage.io_manager import IOManagerDefinition
 from dagster._core.test_utils import instance_for_test
-from dagster._utils import file_relative_path
+from dagster._utils import PICKLE_PROTOCOL, file_relative_path
 
 
 def define_job(io_manager: IOManagerDefinition):
@@ -107,6 +107,18 @@ def test_fs_io_manager_base_dir():
             assert pickle.load(read_obj) == [1, 2, 3]
 
 
+def test_fs_io_manager_pickle_protocol():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        io_manager = fs_io_manager.configured({"base_dir": tmpdir_path})
+        result = define_job(io_manager).execute_in_process()
+        assert result.success
+
+        filepath_a = os.path.join(tmpdir_path, result.run_id, "op_a", "result")
+        with open(filepath_a, "rb") as read_obj:
+            # pickle streams start with the PROTO opcode followed by the protocol number
+            assert read_obj.read(2) == pickle.PROTO + bytes([PICKLE_PROTOCOL])
+
+
 # lamdba functions can't be pickled (pickle.PicklingError)
 lam = lambda x: x * x
 
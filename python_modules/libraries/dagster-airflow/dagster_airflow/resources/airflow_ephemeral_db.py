@@ -42,7 +42,7 @@ def _initialize_database(
         os.environ["AIRFLOW_HOME"] = airflow_home_path
         os.makedirs(airflow_home_path, exist_ok=True)
         with Locker(airflow_home_path):
-            airflow_initialized = os.path.exists(f"{airflow_home_path}/airflow.db")
+            airflow_initialized = os.path.exists(os.path.join(airflow_home_path, "airflow.db"))
             # because AIRFLOW_HOME has been overriden airflow needs to be reloaded
             if is_airflow_2_loaded_in_environment():
                 importlib.reload(airflow.configuration)
@@ -2,7 +2,7 @@
 import os
 import sys
 from contextlib import contextmanager
-from typing import Generator, List, Mapping, Optional
+from typing import Dict, Generator, List, Mapping, Optional
 
 from airflow import __version__ as airflow_version
 from airflow.models.connection import Connection
@@ -30,43 +30,92 @@ class DagsterAirflowError(Exception):
 
 
 def create_airflow_connections(connections: List[Connection] = []) -> None:
+    if not connections:
+        return
+
     with create_session() as session:
+        # look up all pre-existing conn_ids in a single query and commit once, rather than
+        # round-tripping to the metadata db per connection
+        existing_conn_ids = {
+            conn_id
+            for (conn_id,) in session.query(Connection.conn_id).filter(
+                Connection.conn_id.in_([connection.conn_id for connection in connections])
+            )
+        }
+        skipped_conn_ids = []
+        new_connections = []
         for connection in connections:
-            if session.query(Connection).filter(Connection.conn_id == connection.conn_id).first():
-                logging.info(
-                    f"Could not import connection {connection.conn_id}: connection already exists."
-                )
+            if connection.conn_id in existing_conn_ids:
+                skipped_conn_ids.append(connection.conn_id)
                 continue
+            existing_conn_ids.add(connection.conn_id)
+            new_connections.append(connection)
+
+        session.add_all(new_connections)
+        session.commit()
+
+    if skipped_conn_ids:
+        logging.info(
+            f"Could not import connections {', '.join(skipped_conn_ids)}: connections already"
+            " exist."
+        )
+    logging.info(f"Imported {len(new_connections)} connections")
+
+
+class _NormalizedNameTable(Dict[int, str]):
+    """str.translate table that maps every character Dagster does not allow in names to '_'.
+
+    All ASCII code points are precomputed from VALID_NAME_REGEX; anything outside ASCII is never
+    valid, so it falls through to __missing__.
+    """
 
-            session.add(connection)
-            session.commit()
-            logging.info(f"Imported connection {connection.conn_id}")
+    def __missing__(self, key: int) -> str:
+        return "_"
+
+
+_NORMALIZED_NAME_TABLE = _NormalizedNameTable(
+    {i: chr(i) if VALID_NAME_REGEX.match(chr(i)) else "_" for i in range(128)}
+)
 
 
 # Airflow DAG ids and Task ids allow a larger valid character set (alphanumeric characters,
 # dashes, dots and underscores) than Dagster's naming conventions (alphanumeric characters,
 # underscores), so Dagster will strip invalid characters and replace with '_'
 def normalized_name(dag_name, task_name=None) -> str:
-    base_name = "".join(c if VALID_NAME_REGEX.match(c) else "_" for c in dag_name)
+    base_name = dag_name.translate(_NORMALIZED_NAME_TABLE)
     if task_name:
         base_name += "__"
-        base_name += "".join(c if VALID_NAME_REGEX.match(c) else "_" for c in task_name)
+        base_name += task_name.translate(_NORMALIZED_NAME_TABLE)
     return base_name
 
 
+_AIRFLOW_TASK_LOGGER = logging.getLogger("airflow.task")
+_AIRFLOW_LOG_FORMATTER = logging.Formatter(LOG_FORMAT)
+
+
 @contextmanager
 def replace_airflow_logger_handlers() -> Generator[None, None, None]:
-    prev_airflow_handlers = logging.getLogger("airflow.task").handlers
+    prev_airflow_handlers = _AIRFLOW_TASK_LOGGER.handlers
     try:
         # Redirect airflow handlers to stdout / compute logs
         handler = logging.StreamHandler(sys.stdout)
-        handler.setFormatter(logging.Formatter(LOG_FORMAT))
-        root = logging.getLogger("airflow.task")
-        root.handlers = [handler]
+        handler.setFormatter(_AIRFLOW_LOG_FORMATTER)
+        _AIRFLOW_TASK_LOGGER.handlers = [handler]
         yield
     finally:
         # Restore previous log handlers
-        logging.getLogger("airflow.task").handlers = prev_airflow_handlers
+        _AIRFLOW_TASK_LOGGER.handlers = prev_airflow_handlers
+
+
+_SERIALIZED_CONNECTION_FIELDS = (
+    "login",
+    "password",
+    "host",
+    "schema",
+    "port",
+    "extra",
+    "description",
+)
 
 
 def serialize_connections(connections: List[Connection] = []) -> List[Mapping[str, Optional[str]]]:
@@ -76,20 +125,11 @@ def serialize_connections(connections: List[Connection] = []) -> List[Mapping[st
             "conn_id": c.conn_id,
             "conn_type": c.conn_type,
         }
-        if hasattr(c, "login") and c.login:
-            serialized_connection["login"] = c.login
-        if hasattr(c, "password") and c.password:
-            serialized_connection["password"] = c.password
-        if hasattr(c, "host") and c.host:
-            serialized_connection["host"] = c.host
-        if hasattr(c, "schema") and c.schema:
-            serialized_connection["schema"] = c.schema
-        if hasattr(c, "port") and c.port:
-            serialized_connection["port"] = c.port
-        if hasattr(c, "extra") and c.extra:
-            serialized_connection["extra"] = c.extra
-        if hasattr(c, "description") and c.description:
-            serialized_connection["description"] = c.description
+        for field in _SERIALIZED_CONNECTION_FIELDS:
+            # read each attribute once: password and extra are properties that decrypt on access
+            value = getattr(c, field, None)
+            if value:
+                serialized_connection[field] = value
         serialized_connections.append(serialized_connection)
     return serialized_connections
 
@@ -118,10 +158,12 @@ def portable_unlock(fp):
 class Locker:
     def __init__(self, lock_file_path="."):
         self.lock_file_path = lock_file_path
+        self.lock_file = os.path.join(lock_file_path, "lockfile.lck")
         self.fp = None
 
     def __enter__(self):
-        self.fp = open(f"{self.lock_file_path}/lockfile.lck", "w+", encoding="utf-8")
+        # open in append mode so that acquiring the lock doesn't truncate the lockfile
+        self.fp = open(self.lock_file, "a+", encoding="utf-8")
         portable_lock(self.fp)
 
     def __exit__(self, _type, value, tb):
@@ -0,0 +1,29 @@
+import io
+import logging
+from contextlib import redirect_stdout
+
+from dagster_airflow.utils import replace_airflow_logger_handlers
+
+from dagster_airflow_tests.marks import requires_no_db
+
+
+@requires_no_db
+def test_replace_airflow_logger_handlers_after_closed_stdout():
+    airflow_task_logger = logging.getLogger("airflow.task")
+    prev_handlers = airflow_task_logger.handlers
+
+    # stdout is redirected to a stream that is closed once the first task finishes. Unlike
+    # StringIO, a closed TextIOWrapper (e.g. pytest's CaptureIO) raises on flush()
+    closed_stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    with redirect_stdout(closed_stdout):
+        with replace_airflow_logger_handlers():
+            airflow_task_logger.warning("first task")
+    closed_stdout.close()
+
+    stdout = io.StringIO()
+    with redirect_stdout(stdout):
+        with replace_airflow_logger_handlers():
+            airflow_task_logger.warning("second task")
+
+    assert "second task" in stdout.getvalue()
+    assert airflow_task_logger.handlers == prev_handlers